@@ -2,30 +2,91 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import signal
 import sys
+import threading
 import time
-from dataclasses import asdict
-from datetime import datetime, timedelta
+from dataclasses import fields
 
 import click
 from rich.console import Console
-from rich.logging import RichHandler
 
 from qbittorrent_sync.config import ConfigError, SyncConfig, load_config
-from qbittorrent_sync.sync import run_sync
 
-console = Console()
+# Terminal/colour detection is settled once here rather than probed by Rich;
+# highlight=False skips the regex highlighter on every printed line.
+console = Console(
+    force_terminal=sys.stdout.isatty() or None,
+    no_color=bool(os.environ.get("NO_COLOR")),
+    highlight=False,
+)
+
+
+def _use_pretty_logs(daemon: bool) -> bool:
+    """Pick RichHandler for interactive runs; ``QBT_SYNC_PRETTY_LOGS`` overrides."""
+    override = os.environ.get("QBT_SYNC_PRETTY_LOGS", "").strip().lower()
+    if override in {"1", "true", "yes", "on"}:
+        return True
+    if override in {"0", "false", "no", "off"}:
+        return False
+    return not daemon and sys.stdout.isatty()
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records over untouched.
+
+    The stock ``prepare`` pre-formats the message and drops ``exc_info`` so the
+    record can be pickled; the queue never leaves this process, and keeping
+    ``exc_info`` lets RichHandler still render rich tracebacks.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _setup_logging(verbose: bool, daemon: bool = False) -> None:
+    global _log_listener
+
+    # Safe to call more than once: the previous listener is flushed and the
+    # root handlers are replaced rather than stacked.
+    _stop_log_listener()
 
-def _setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True, show_path=False)],
-    )
+    if _use_pretty_logs(daemon):
+        from rich.logging import RichHandler
+
+        handler: logging.Handler = RichHandler(console=console, rich_tracebacks=True, show_path=False)
+        handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    else:
+        # RichHandler is far slower than a plain stream handler; nobody is
+        # looking at the colours in a container log or a pipe.
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s %(message)s", datefmt="[%X]"))
+
+    # Callers only enqueue records; a single listener thread does the writes.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.unregister(_stop_log_listener)
+    atexit.register(_stop_log_listener)
+
+    logging.basicConfig(level=level, handlers=[_InProcessQueueHandler(log_queue)], force=True)
 
 
 @click.command()
@@ -58,7 +119,7 @@ def _setup_logging(verbose: bool) -> None:
 )
 def main(config_path: str, dry_run: bool, verbose: bool, daemon: bool) -> None:
     """Synchronize torrents from a master qBittorrent instance to children."""
-    _setup_logging(verbose)
+    _setup_logging(verbose, daemon)
     log = logging.getLogger("qbt-sync")
 
     try:
@@ -68,13 +129,18 @@ def main(config_path: str, dry_run: bool, verbose: bool, daemon: bool) -> None:
         sys.exit(1)
 
     effective_dry_run = cfg.sync.dry_run if dry_run is None else dry_run
-    log.debug("Loaded config: master=%s, children=%d, dry_run=%s", cfg.master.host, len(cfg.children), effective_dry_run)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Loaded config: master=%s, children=%d, dry_run=%s", cfg.master.host, len(cfg.children), effective_dry_run)
 
     try:
         if daemon:
             _run_daemon(config_path, dry_run_override=dry_run, log=log)
         else:
-            run_sync(cfg, dry_run=effective_dry_run, console=console)
+            from qbittorrent_sync.sync import run_sync
+
+            _, failed = run_sync(cfg, dry_run=effective_dry_run, console=console)
+            if failed:
+                sys.exit(1)
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted.[/]")
         sys.exit(130)
@@ -83,16 +149,29 @@ def main(config_path: str, dry_run: bool, verbose: bool, daemon: bool) -> None:
         sys.exit(1)
 
 
+# Set by SIGTERM (e.g. ``docker stop``) to end the daemon loop at the next wait.
+_stop = threading.Event()
+
+
+def _request_stop(signum: int, frame: object) -> None:
+    _stop.set()
+
+
 def _run_daemon(config_path: str, *, dry_run_override: bool | None, log: logging.Logger) -> None:
+    from qbittorrent_sync.sync import run_sync
+
+    signal.signal(signal.SIGTERM, _request_stop)
     console.print("\n[bold]Daemon mode:[/] Press Ctrl+C to stop.\n")
     prev_sync: SyncConfig | None = None
+    current_interval: int | None = None
 
     while True:
         try:
             cfg = load_config(config_path)
         except ConfigError as exc:
             log.error("Failed to reload config: %s — will retry next cycle", exc)
-            time.sleep(60)
+            if _stop.wait(60):
+                break
             continue
 
         if prev_sync is not None:
@@ -100,34 +179,73 @@ def _run_daemon(config_path: str, *, dry_run_override: bool | None, log: logging
         prev_sync = cfg.sync
 
         dry_run = cfg.sync.dry_run if dry_run_override is None else dry_run_override
-        interval = cfg.sync.daemon_run_interval_minutes
+        base_interval = cfg.sync.daemon_run_interval_minutes
+        max_interval = max(base_interval, cfg.sync.max_poll_interval_minutes)
+        if not cfg.sync.adaptive_interval or current_interval is None:
+            current_interval = base_interval
+        current_interval = min(max(current_interval, base_interval), max_interval)
+        interval = current_interval
 
         start = time.monotonic()
-        console.rule(f"[bold]Sync started at {datetime.now():%Y-%m-%d %H:%M:%S}[/]")
+        # Schedule against the cycle start so the sync duration doesn't push
+        # every subsequent run later.
+        deadline = start + interval * 60
+        console.rule(f"[bold]Sync started at {time.strftime('%Y-%m-%d %H:%M:%S')}[/]")
 
+        changes: int | None = None
         try:
-            run_sync(cfg, dry_run=dry_run, console=console)
+            changes, failed = run_sync(cfg, dry_run=dry_run, console=console)
+            if failed:
+                # Treated like a failed cycle so the interval snaps back.
+                changes = None
         except KeyboardInterrupt:
             raise
         except Exception:
             log.exception("Sync failed — will retry next cycle")
 
-        elapsed = time.monotonic() - start
-        next_run = datetime.now() + timedelta(minutes=interval)
+        if cfg.sync.adaptive_interval:
+            current_interval = _next_interval(current_interval, changes, base_interval, max_interval)
+            if current_interval != interval:
+                # Re-anchor the deadline on the adapted interval.
+                interval = current_interval
+                deadline = start + interval * 60
+
+        now = time.monotonic()
+        remaining = max(0.0, deadline - now)
+        next_run = time.strftime("%H:%M:%S", time.localtime(time.time() + remaining))
         console.print(
-            f"\n[dim]Sync completed in {elapsed:.1f}s. "
-            f"Next run at {next_run:%H:%M:%S} ({interval}m interval).[/]\n"
+            f"\n[dim]Sync completed in {now - start:.1f}s. "
+            f"Next run at {next_run} ({interval}m interval).[/]\n"
         )
 
-        time.sleep(interval * 60)
+        if _stop.wait(remaining):
+            break
+
+    console.print("\n[yellow]Stopped.[/]")
+
+
+def _next_interval(current: int, changes: int | None, base: int, maximum: int) -> int:
+    """Double the interval after an idle cycle, snap back to *base* after any activity.
+
+    A failed cycle (``changes is None``) also resets to *base* so it is retried promptly.
+    """
+    if changes is None or changes > 0:
+        return base
+    return min(maximum, current * 2)
 
 
 def _log_sync_changes(old: SyncConfig, new: SyncConfig, log: logging.Logger) -> None:
-    old_d, new_d = asdict(old), asdict(new)
-    changes = {k: (old_d[k], new_d[k]) for k in old_d if old_d[k] != new_d[k]}
-    if changes:
-        log.info("Config reloaded — sync options changed:")
-        for key, (prev, curr) in changes.items():
-            log.info("  %s: %s → %s", key, prev, curr)
-    else:
+    # The config cache returns the same object while the file is unchanged.
+    if old is new or old == new:
         log.debug("Config reloaded — no sync option changes.")
+        return
+    if not log.isEnabledFor(logging.INFO):
+        return
+    changes = [
+        (f.name, getattr(old, f.name), getattr(new, f.name))
+        for f in fields(old)
+        if getattr(old, f.name) != getattr(new, f.name)
+    ]
+    log.info("Config reloaded — sync options changed:")
+    for key, prev, curr in changes:
+        log.info("  %s: %s → %s", key, prev, curr)
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
-import yaml
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstanceConfig:
     """Connection details for a qBittorrent instance."""
 
@@ -22,7 +22,7 @@ class InstanceConfig:
     tracker_exclude: list[re.Pattern[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SyncConfig:
     """Tuning knobs for the sync behaviour."""
 
@@ -33,9 +33,15 @@ class SyncConfig:
     sync_file_selections: bool = False
     treat_stopped_as_removed: bool = False
     daemon_run_interval_minutes: int = 15
+    adaptive_interval: bool = False
+    max_poll_interval_minutes: int = 120
+    fetch_concurrency: int = 8
+    incremental_master_fetch: bool = False
+    export_cache_mb: int = 0
+    export_cache_dir: str = "~/.cache/qbt-sync/exports"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Top-level application configuration."""
 
@@ -62,15 +68,24 @@ def _compile_patterns(raw: list | None, field_name: str, instance_name: str) ->
     return patterns
 
 
+_REQUIRED_INSTANCE_FIELDS = ("host", "username", "password")
+_get_required_instance_fields = itemgetter(*_REQUIRED_INSTANCE_FIELDS)
+
+
 def _parse_instance(data: dict, default_name: str = "") -> InstanceConfig:
-    missing = [k for k in ("host", "username", "password") if k not in data]
-    if missing:
-        raise ConfigError(f"Instance config missing required fields: {', '.join(missing)}")
+    try:
+        host, username, password = _get_required_instance_fields(data)
+    except KeyError:
+        missing = [k for k in _REQUIRED_INSTANCE_FIELDS if k not in data]
+        raise ConfigError(f"Instance config missing required fields: {', '.join(missing)}") from None
     name = data.get("name", default_name)
+    # Children commonly repeat the same host/username; share one copy.
+    # Non-string values (e.g. an unquoted numeric username) pass through as
+    # before. Passwords are deliberately left out of the intern table.
     return InstanceConfig(
-        host=data["host"],
-        username=data["username"],
-        password=data["password"],
+        host=sys.intern(host) if isinstance(host, str) else host,
+        username=sys.intern(username) if isinstance(username, str) else username,
+        password=password,
         name=name,
         path=data.get("path", ""),
         tracker_include=_compile_patterns(data.get("tracker_include"), "tracker_include", name),
@@ -78,38 +93,114 @@ def _parse_instance(data: dict, default_name: str = "") -> InstanceConfig:
     )
 
 
+# Parsed configs keyed by path, tagged with the (mtime_ns, size) they were read at.
+_CFG_CACHE: dict[str, tuple[int, int, AppConfig]] = {}
+
+
 def load_config(path: str | Path) -> AppConfig:
-    """Load and validate a YAML config file, returning an ``AppConfig``."""
+    """Load and validate a YAML config file, returning an ``AppConfig``.
+
+    Repeated calls for an unchanged file return the previously parsed object.
+    """
     config_path = Path(path)
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         raise ConfigError(f"Config file not found: {config_path}")
 
-    with open(config_path) as fh:
-        raw = yaml.safe_load(fh)
+    key = str(config_path)
+    cached = _CFG_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
 
-    if not isinstance(raw, dict):
-        raise ConfigError("Config file must be a YAML mapping")
+    cfg = _parse_config(config_path)
+    _CFG_CACHE[key] = (st.st_mtime_ns, st.st_size, cfg)
+    return cfg
 
-    if "master" not in raw:
-        raise ConfigError("Config must contain a 'master' section")
-    master = _parse_instance(raw["master"], default_name="master")
 
-    if "children" not in raw or not raw["children"]:
-        raise ConfigError("Config must contain a non-empty 'children' list")
+def _parse_config(config_path: Path) -> AppConfig:
+    # Imported lazily so ``--help`` doesn't pay for PyYAML.
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+    try:
+        raw = yaml.load(config_path.read_bytes(), Loader=SafeLoader)
+    except yaml.YAMLError as exc:
+        raise ConfigError(f"Invalid YAML in {config_path}: {exc}") from None
+
+    _check_structure(raw)
+    master = _parse_instance(raw["master"], default_name="master")
     children = [
         _parse_instance(child, default_name=f"child-{i}")
         for i, child in enumerate(raw["children"], start=1)
     ]
 
-    sync_raw = raw.get("sync", {})
-    sync = SyncConfig(
-        min_seeding_time_minutes=int(sync_raw.get("min_seeding_time_minutes", 10)),
-        skip_hash_check=bool(sync_raw.get("skip_hash_check", True)),
-        dry_run=bool(sync_raw.get("dry_run", True)),
-        private_only=bool(sync_raw.get("private_only", True)),
-        sync_file_selections=bool(sync_raw.get("sync_file_selections", False)),
-        treat_stopped_as_removed=bool(sync_raw.get("treat_stopped_as_removed", False)),
-        daemon_run_interval_minutes=int(sync_raw.get("daemon_run_interval_minutes", 15)),
-    )
+    sync = _parse_sync(raw.get("sync") or {})
 
     return AppConfig(master=master, children=children, sync=sync)
+
+
+def _check_structure(raw: object) -> None:
+    """Validate the overall shape of the document before parsing any section."""
+    if not isinstance(raw, dict):
+        raise ConfigError("Config file must be a YAML mapping")
+
+    if "master" not in raw:
+        raise ConfigError("Config must contain a 'master' section")
+    if not isinstance(raw["master"], dict):
+        raise ConfigError("'master' section must be a YAML mapping")
+
+    children = raw.get("children")
+    if not children:
+        raise ConfigError("Config must contain a non-empty 'children' list")
+    if not isinstance(children, list):
+        raise ConfigError("'children' must be a YAML list")
+    for i, child in enumerate(children, start=1):
+        if not isinstance(child, dict):
+            raise ConfigError(f"Child #{i} must be a YAML mapping")
+
+
+def _get_int(data: dict, key: str, default: int, minimum: int) -> int:
+    value = data.get(key, default)
+    # bool is a subclass of int; ``true`` is not a valid number of minutes.
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise ConfigError(f"sync.{key} must be an integer >= {minimum}, got {value!r}")
+    return value
+
+
+def _get_bool(data: dict, key: str, default: bool) -> bool:
+    value = data.get(key, default)
+    if not isinstance(value, bool):
+        raise ConfigError(f"sync.{key} must be true or false, got {value!r}")
+    return value
+
+
+def _get_str(data: dict, key: str, default: str) -> str:
+    value = data.get(key, default)
+    if not isinstance(value, str) or not value:
+        raise ConfigError(f"sync.{key} must be a non-empty string, got {value!r}")
+    return value
+
+
+def _parse_sync(data: dict) -> SyncConfig:
+    if not isinstance(data, dict):
+        raise ConfigError("'sync' section must be a YAML mapping")
+    return SyncConfig(
+        min_seeding_time_minutes=_get_int(data, "min_seeding_time_minutes", 10, minimum=0),
+        skip_hash_check=_get_bool(data, "skip_hash_check", True),
+        dry_run=_get_bool(data, "dry_run", True),
+        private_only=_get_bool(data, "private_only", True),
+        sync_file_selections=_get_bool(data, "sync_file_selections", False),
+        treat_stopped_as_removed=_get_bool(data, "treat_stopped_as_removed", False),
+        daemon_run_interval_minutes=_get_int(data, "daemon_run_interval_minutes", 15, minimum=1),
+        adaptive_interval=_get_bool(data, "adaptive_interval", False),
+        max_poll_interval_minutes=_get_int(data, "max_poll_interval_minutes", 120, minimum=1),
+        fetch_concurrency=_get_int(data, "fetch_concurrency", 8, minimum=1),
+        incremental_master_fetch=_get_bool(data, "incremental_master_fetch", False),
+        export_cache_mb=_get_int(data, "export_cache_mb", 0, minimum=0),
+        export_cache_dir=_get_str(data, "export_cache_dir", "~/.cache/qbt-sync/exports"),
+    )
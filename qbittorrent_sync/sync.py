@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import logging
+import os
 import re
+import sys
+import threading
 import time
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
 
 import qbittorrentapi
 from rich.console import Console
@@ -20,7 +31,7 @@ log = logging.getLogger("qbt-sync")
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TorrentEntry:
     """Lightweight snapshot of a torrent's sync-relevant properties."""
 
@@ -31,10 +42,14 @@ class TorrentEntry:
     content_path: str
     download_path: str = ""
     tracker: str = ""
-    file_priorities: list[int] | None = None
+    # One byte per file (qBittorrent priorities are 0–7).
+    file_priorities: bytes | None = None
+    # Derived from file_priorities by _set_file_priorities().
+    has_deselected: bool = False
+    deselected_ids: tuple[int, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncDiff:
     """Computed diff between master and a single child."""
 
@@ -43,46 +58,152 @@ class SyncDiff:
     to_add: list[TorrentEntry] = field(default_factory=list)
     to_recategorize: list[tuple[TorrentEntry, TorrentEntry]] = field(default_factory=list)
     to_relocate: list[tuple[TorrentEntry, TorrentEntry]] = field(default_factory=list)
-    to_sync_files: list[TorrentEntry] = field(default_factory=list)
+    # (master entry, file ids to deselect on the child)
+    to_sync_files: list[tuple[TorrentEntry, tuple[int, ...]]] = field(default_factory=list)
 
     @property
     def is_empty(self) -> bool:
+        return not (
+            self.to_delete
+            or self.to_add
+            or self.to_recategorize
+            or self.to_relocate
+            or self.to_sync_files
+        )
+
+    @property
+    def change_count(self) -> int:
         return (
-            not self.to_delete
-            and not self.to_add
-            and not self.to_recategorize
-            and not self.to_relocate
-            and not self.to_sync_files
+            len(self.to_delete)
+            + len(self.to_add)
+            + len(self.to_recategorize)
+            + len(self.to_relocate)
+            + len(self.to_sync_files)
         )
 
 
+@dataclass(slots=True)
+class ChildResult:
+    """Outcome of one sync cycle for a single child."""
+
+    child_name: str
+    changes: int = 0
+    deleted: int = 0
+    added: int = 0
+    recategorized: int = 0
+    relocated: int = 0
+    file_synced: int = 0
+    # Set when the child could not be synced (connection or unexpected error).
+    failed: bool = False
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _connect(instance: InstanceConfig) -> qbittorrentapi.Client:
+def _master_connections(cfg: AppConfig) -> int:
+    """Concurrent requests the shared master client may see.
+
+    Every child syncs in its own thread and runs its own pool of exports
+    against master, so the master pool has to cover all of them.
+    """
+    return cfg.sync.fetch_concurrency * max(1, len(cfg.children))
+
+
+def _connect(instance: InstanceConfig, max_connections: int = 8) -> qbittorrentapi.Client:
+    """Log in to *instance*.
+
+    The client reuses one HTTP session (keep-alive) for all calls; its pool is
+    sized so that *max_connections* concurrent requests each keep their
+    connection instead of reconnecting.
+    """
     client = qbittorrentapi.Client(
         host=instance.host,
         username=instance.username,
         password=instance.password,
+        # Plain dicts/lists instead of attribute-dict wrappers around every
+        # torrent and file entry.
+        SIMPLE_RESPONSES=True,
+        HTTPADAPTER_ARGS={"pool_maxsize": max(max_connections, 10)},
     )
     client.auth_log_in()
     log.debug("Connected to %s (%s)", instance.name, instance.host)
     return client
 
 
-def _torrent_to_entry(t: qbittorrentapi.TorrentDictionary) -> TorrentEntry:
+# Positional order matches the leading TorrentEntry fields.
+_get_entry_fields = itemgetter(
+    "hash", "name", "save_path", "category", "content_path", "download_path", "tracker",
+)
+
+
+def _torrent_to_entry(t: dict) -> TorrentEntry:
+    try:
+        h, name, save_path, category, content_path, download_path, tracker = _get_entry_fields(t)
+    except KeyError:
+        # Older qBittorrent versions omit some fields (e.g. download_path).
+        h = t["hash"]
+        name = t.get("name", "")
+        save_path = t.get("save_path", "")
+        category = t.get("category", "")
+        content_path = t.get("content_path", "")
+        download_path = t.get("download_path", "")
+        tracker = t.get("tracker", "")
+    # Paths, categories and trackers repeat across thousands of torrents;
+    # share one copy of each instead of keeping a fresh string per entry.
     return TorrentEntry(
-        hash=t["hash"],
-        name=t.get("name", ""),
-        save_path=t.get("save_path", ""),
-        category=t.get("category", ""),
-        content_path=t.get("content_path", ""),
-        download_path=t.get("download_path", ""),
-        tracker=t.get("tracker", ""),
+        h, name, sys.intern(save_path), sys.intern(category), content_path,
+        sys.intern(download_path), sys.intern(tracker),
     )
 
 
+_get_child_entry_fields = itemgetter("hash", "name", "save_path", "category", "download_path")
+
+
+def _torrent_to_entry_minimal(t: dict) -> TorrentEntry:
+    """Build a child-side entry with only the fields the diff compares.
+
+    content_path and tracker are only ever read from master entries.
+    """
+    try:
+        h, name, save_path, category, download_path = _get_child_entry_fields(t)
+    except KeyError:
+        h = t["hash"]
+        name = t.get("name", "")
+        save_path = t.get("save_path", "")
+        category = t.get("category", "")
+        download_path = t.get("download_path", "")
+    return TorrentEntry(
+        h, name, sys.intern(save_path), sys.intern(category), "", sys.intern(download_path),
+    )
+
+
+def _fetch_files_parallel(
+    client: qbittorrentapi.Client,
+    hashes: list[str],
+    workers: int = 8,
+    abort: threading.Event | None = None,
+) -> dict[str, list | None]:
+    """Fetch the file list of every hash concurrently.
+
+    Each ``torrents_files`` call is a full HTTP round trip, so keeping several
+    in flight hides most of the latency. Failed fetches map to ``None``, as do
+    those skipped once *abort* is set.
+    """
+    def fetch(h: str) -> list | None:
+        if abort is not None and abort.is_set():
+            return None
+        try:
+            return client.torrents_files(torrent_hash=h)
+        except Exception:
+            return None
+
+    if not hashes:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(hashes))) as pool:
+        return dict(zip(hashes, pool.map(fetch, hashes)))
+
+
 def _translate_path(path: str, master_prefix: str, child_prefix: str) -> str:
     """Replace *master_prefix* at the start of *path* with *child_prefix*."""
     if not master_prefix or not child_prefix or not path:
@@ -112,10 +233,35 @@ def _translate_entry(
         download_path=_translate_path(entry.download_path, master_prefix, child_prefix) if entry.download_path else "",
         tracker=entry.tracker,
         file_priorities=entry.file_priorities,
+        has_deselected=entry.has_deselected,
+        deselected_ids=entry.deselected_ids,
+    )
+
+
+# Stand-in priorities for a torrent known to have every file selected; the
+# per-file list is never needed for those.
+_ALL_FILES_SELECTED = b""
+
+
+def _set_file_priorities(entry: TorrentEntry, priorities: bytes) -> None:
+    """Store *priorities* on *entry* along with its deselected file indices."""
+    # The C-level membership test settles the common all-selected case.
+    has_deselected = 0 in priorities
+    entry.deselected_ids = (
+        tuple(i for i, p in enumerate(priorities) if p == 0) if has_deselected else ()
     )
+    entry.has_deselected = has_deselected
+    # Assigned last: other child threads sharing this entry treat a non-None
+    # file_priorities as "loaded" and read the derived fields right away.
+    entry.file_priorities = priorities
 
 
-_PAUSED_STATES = {"pausedup", "pauseddl"}
+_PAUSED_STATES = frozenset({"pausedup", "pauseddl"})
+_COMPLETED_STATES = frozenset({
+    "uploading", "stalledup", "forcedup",
+    "pausedup", "queuedup", "checkingup",
+    "seeding", "completed",
+})
 
 
 def _fetch_master_torrents(
@@ -127,20 +273,29 @@ def _fetch_master_torrents(
     private_only: bool = True,
     tracker_include: list[re.Pattern[str]] | None = None,
     tracker_exclude: list[re.Pattern[str]] | None = None,
+    workers: int = 8,
+    snapshot: MasterSnapshot | None = None,
 ) -> dict[str, TorrentEntry]:
-    """Return eligible master torrents keyed by info-hash."""
-    torrents = client.torrents_info()
+    """Return eligible master torrents keyed by info-hash.
+
+    With a *snapshot*, the torrent list is refreshed incrementally via
+    ``sync/maindata`` and file priorities are reused for torrents whose
+    size/progress haven't changed since the previous cycle.
+    """
+    if snapshot is not None:
+        torrents = snapshot.refresh(client)
+    else:
+        torrents = client.torrents_info()
 
     if tracker_include or tracker_exclude:
         before = len(torrents)
         filtered: list = []
+        verdicts: dict[str, str | None] = {}
         for t in torrents:
             tracker = t.get("tracker", "")
-            if tracker_include and not any(p.search(tracker) for p in tracker_include):
-                log.debug("Master tracker filter (include miss): %s [%s]", t.get("name", t["hash"]), tracker)
-                continue
-            if tracker_exclude and any(p.search(tracker) for p in tracker_exclude):
-                log.debug("Master tracker filter (exclude hit): %s [%s]", t.get("name", t["hash"]), tracker)
+            reason = _tracker_rejection(tracker, tracker_include, tracker_exclude, verdicts)
+            if reason:
+                log.debug("Master tracker filter (%s): %s [%s]", reason, t.get("name", t["hash"]), tracker)
                 continue
             filtered.append(t)
         torrents = filtered
@@ -162,11 +317,7 @@ def _fetch_master_torrents(
             log.debug("Skipping public torrent: %s", t.get("name", t["hash"]))
             continue
 
-        is_completed = state in {
-            "uploading", "stalledup", "forcedup",
-            "pausedup", "queuedup", "checkingup",
-            "seeding", "completed",
-        }
+        is_completed = state in _COMPLETED_STATES
         if not is_completed and t.get("progress", 0) < 1.0:
             continue
 
@@ -180,7 +331,12 @@ def _fetch_master_torrents(
             )
             continue
 
-        result[t["hash"]] = _torrent_to_entry(t)
+        entry = result[t["hash"]] = _torrent_to_entry(t)
+        # ``size`` only counts selected files; when it equals ``total_size``
+        # nothing is deselected and the file list need not be fetched.
+        size = t.get("size")
+        if size is not None and size == t.get("total_size"):
+            _set_file_priorities(entry, _ALL_FILES_SELECTED)
 
     if treat_stopped_as_removed and stopped_count:
         log.info("Excluded %d stopped/paused torrent(s) from master (treated as removed)", stopped_count)
@@ -189,17 +345,31 @@ def _fetch_master_torrents(
         log.info("Excluded %d public torrent(s) from master", public_count)
 
     if load_file_priorities:
-        for h, entry in result.items():
-            try:
-                files = client.torrents_files(torrent_hash=h)
-                entry.file_priorities = [f.priority for f in files]
-            except Exception:
+        to_fetch = [h for h, e in result.items() if e.file_priorities is None]
+        log.debug("%d torrent(s) have every file selected", len(result) - len(to_fetch))
+        if snapshot is not None:
+            uncached = []
+            for h in to_fetch:
+                cached = snapshot.cached_priorities(h)
+                if cached is None:
+                    uncached.append(h)
+                else:
+                    _set_file_priorities(result[h], cached)
+            log.debug("Reused file priorities for %d torrent(s)", len(to_fetch) - len(uncached))
+            to_fetch = uncached
+
+        files_by_hash = _fetch_files_parallel(client, to_fetch, workers)
+        for h in to_fetch:
+            entry = result[h]
+            files = files_by_hash[h]
+            if files is None:
                 log.warning("Failed to fetch file priorities for %s", entry.name)
+                continue
+            _set_file_priorities(entry, bytes(f["priority"] for f in files))
+            if snapshot is not None:
+                snapshot.store_priorities(h, entry.file_priorities)
 
-        deselected_count = sum(
-            1 for e in result.values()
-            if e.file_priorities and any(p == 0 for p in e.file_priorities)
-        )
+        deselected_count = sum(1 for e in result.values() if e.has_deselected)
         if deselected_count:
             log.info("%d torrent(s) have deselected files on master", deselected_count)
 
@@ -208,9 +378,15 @@ def _fetch_master_torrents(
 
 def _fetch_child_torrents(
     client: qbittorrentapi.Client,
+    torrents: list | None = None,
 ) -> dict[str, TorrentEntry]:
-    """Return all torrents on a child instance keyed by info-hash."""
-    return {t["hash"]: _torrent_to_entry(t) for t in client.torrents_info()}
+    """Return all torrents on a child instance keyed by info-hash.
+
+    Pass *torrents* to reuse an already fetched ``torrents_info`` response.
+    """
+    if torrents is None:
+        torrents = client.torrents_info()
+    return {t["hash"]: _torrent_to_entry_minimal(t) for t in torrents}
 
 
 # ---------------------------------------------------------------------------
@@ -224,24 +400,28 @@ def compute_diff(
 ) -> SyncDiff:
     diff = SyncDiff(child_name=child_name)
 
-    master_hashes = set(master)
-    child_hashes = set(child)
-
-    for h in child_hashes - master_hashes:
-        diff.to_delete.append(child[h])
-
-    for h in master_hashes - child_hashes:
-        diff.to_add.append(master[h])
-
-    for h in master_hashes & child_hashes:
-        if master[h].category != child[h].category:
-            diff.to_recategorize.append((master[h], child[h]))
-        save_differs = master[h].save_path != child[h].save_path
-        dl_differs = master[h].download_path != child[h].download_path
-        if save_differs or dl_differs:
-            diff.to_relocate.append((master[h], child[h]))
-        if master[h].file_priorities and any(p == 0 for p in master[h].file_priorities):
-            diff.to_sync_files.append(master[h])
+    # One pass over master with a single dict probe per hash, then one pass
+    # over child for deletions — no intermediate sets.
+    matched = 0
+    for h, m in master.items():
+        c = child.get(h)
+        if c is None:
+            diff.to_add.append(m)
+            continue
+        matched += 1
+        if m.category != c.category:
+            diff.to_recategorize.append((m, c))
+        if m.save_path != c.save_path or m.download_path != c.download_path:
+            diff.to_relocate.append((m, c))
+        if m.has_deselected:
+            diff.to_sync_files.append((m, m.deselected_ids))
+
+    # If every child hash was matched above there is nothing to delete — the
+    # common idle case — so the second pass can be skipped.
+    if matched != len(child):
+        for h, c in child.items():
+            if h not in master:
+                diff.to_delete.append(c)
 
     return diff
 
@@ -268,101 +448,341 @@ def _apply_adds(
     child_client: qbittorrentapi.Client,
     entries: list[TorrentEntry],
     skip_hash_check: bool,
+    workers: int = 8,
+    export_cache: ExportCache | None = None,
+    abort: threading.Event | None = None,
 ) -> int:
+    """Add *entries* to the child, batching adds that share target parameters.
+
+    Exports (and any missing file-priority lookups) run on a pool first.
+    Torrents with deselected files are added one by one, paused, so their
+    priorities can be set before they start; the rest are grouped by
+    ``(save_path, category, download_path)`` and sent in one ``torrents_add``
+    request per group. Once *abort* is set, remaining work is skipped.
+    """
+    if not entries:
+        return 0
+
+    def aborted() -> bool:
+        return abort is not None and abort.is_set()
+
+    def prepare(entry: TorrentEntry) -> bytes | None:
+        if aborted():
+            return None
+        return _export_for_add(master_client, entry, export_cache)
+
+    pool_size = min(workers, len(entries))
+    with ThreadPoolExecutor(max_workers=pool_size) as pool:
+        blobs = list(pool.map(prepare, entries))
+
+    singles: list[tuple[TorrentEntry, bytes]] = []
+    groups: dict[tuple[str, str, str], list[tuple[TorrentEntry, bytes]]] = defaultdict(list)
+    for entry, blob in zip(entries, blobs):
+        if blob is None:
+            continue
+        if entry.has_deselected:
+            singles.append((entry, blob))
+        else:
+            groups[(entry.save_path, entry.category, entry.download_path)].append((entry, blob))
+
+    def add_single(item: tuple[TorrentEntry, bytes]) -> bool:
+        if aborted():
+            return False
+        return _add_one(child_client, item[0], item[1], skip_hash_check, abort)
+
     added = 0
-    for entry in entries:
+    for group in groups.values():
+        for chunk in _add_chunks(group):
+            if aborted():
+                break
+            added += _add_batch(child_client, chunk, skip_hash_check, abort)
+    if singles:
+        with ThreadPoolExecutor(max_workers=min(pool_size, len(singles))) as pool:
+            ok = list(pool.map(add_single, singles))
+        # Paused adds are started together once all their priorities are set
+        # (also after an abort, so none is left stopped).
+        paused = [entry.hash for (entry, _), was_added in zip(singles, ok) if was_added]
+        if paused:
+            try:
+                child_client.torrents_resume(torrent_hashes=paused)
+            except Exception:
+                log.warning("Failed to resume %d newly added torrent(s)", len(paused), exc_info=True)
+        added += len(paused)
+    return added
+
+
+def _export_for_add(
+    master_client: qbittorrentapi.Client,
+    entry: TorrentEntry,
+    export_cache: ExportCache | None = None,
+) -> bytes | None:
+    """Export *entry*'s .torrent from master, loading its file priorities if unknown."""
+    torrent_bytes = export_cache.get(entry.hash) if export_cache is not None else None
+    if torrent_bytes is None:
         try:
             torrent_bytes = master_client.torrents_export(torrent_hash=entry.hash)
         except Exception:
             log.warning("Failed to export .torrent for %s — skipping", entry.name)
-            continue
+            return None
+        if export_cache is not None:
+            export_cache.put(entry.hash, torrent_bytes)
 
-        if entry.file_priorities is None:
-            try:
-                files = master_client.torrents_files(torrent_hash=entry.hash)
-                entry.file_priorities = [f.priority for f in files]
-            except Exception:
-                log.warning("Failed to fetch file priorities for %s", entry.name)
+    if entry.file_priorities is None:
+        try:
+            files = master_client.torrents_files(torrent_hash=entry.hash)
+            _set_file_priorities(entry, bytes(f["priority"] for f in files))
+        except Exception:
+            log.warning("Failed to fetch file priorities for %s", entry.name)
+    return torrent_bytes
 
-        has_deselected = entry.file_priorities and any(
-            p == 0 for p in entry.file_priorities
-        )
 
-        add_kwargs: dict = dict(
-            torrent_files=torrent_bytes,
-            save_path=entry.save_path,
-            category=entry.category,
-            is_skip_checking=skip_hash_check,
-            use_auto_torrent_management=False,
-            is_paused=has_deselected,
+def _log_added(entry: TorrentEntry) -> None:
+    if entry.download_path:
+        log.info(
+            "Added torrent: %s → %s (temp: %s)",
+            entry.name, entry.save_path, entry.download_path,
         )
-        if entry.download_path:
-            add_kwargs["download_path"] = entry.download_path
+    else:
+        log.info("Added torrent: %s → %s", entry.name, entry.save_path)
+
+
+# Upper bounds for one batched torrents_add request, so the multipart body
+# stays well below qBittorrent's request size limit.
+_ADD_BATCH_MAX_FILES = 50
+_ADD_BATCH_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _add_chunks(
+    items: list[tuple[TorrentEntry, bytes]],
+) -> list[list[tuple[TorrentEntry, bytes]]]:
+    """Split *items* into batches bounded by file count and total size."""
+    chunks: list[list[tuple[TorrentEntry, bytes]]] = []
+    current: list[tuple[TorrentEntry, bytes]] = []
+    size = 0
+    for item in items:
+        if current and (
+            len(current) >= _ADD_BATCH_MAX_FILES
+            or size + len(item[1]) > _ADD_BATCH_MAX_BYTES
+        ):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += len(item[1])
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _add_batch(
+    child_client: qbittorrentapi.Client,
+    items: list[tuple[TorrentEntry, bytes]],
+    skip_hash_check: bool,
+    abort: threading.Event | None = None,
+) -> int:
+    """Add torrents sharing the same target parameters in a single request.
 
-        try:
-            child_client.torrents_add(**add_kwargs)
-            if entry.download_path:
-                log.info(
-                    "Added torrent: %s → %s (temp: %s)",
-                    entry.name, entry.save_path, entry.download_path,
-                )
-            else:
-                log.info("Added torrent: %s → %s", entry.name, entry.save_path)
+    qBittorrent reports success for a multi-file add as soon as one file is
+    accepted, so unless the response says every file went in, the child is
+    asked which hashes arrived. Torrents that didn't are retried on their own
+    so the outcome is reported per torrent. Hashes already on the child are
+    skipped up front.
+    """
+    # Torrents already on the child would look "arrived" below; drop them
+    # first, as _add_one does on a 409.
+    try:
+        present = {
+            t["hash"] for t in child_client.torrents_info(torrent_hashes=[e.hash for e, _ in items])
+        }
+    except Exception:
+        present = set()
+    if present:
+        for entry, _ in items:
+            if entry.hash in present:
+                log.debug("Torrent already exists on child: %s", entry.name)
+        items = [item for item in items if item[0].hash not in present]
+        if not items:
+            return 0
+
+    if len(items) == 1:
+        return int(_add_one(child_client, items[0][0], items[0][1], skip_hash_check, abort))
+
+    first = items[0][0]
+    add_kwargs: dict = dict(
+        torrent_files=[blob for _, blob in items],
+        save_path=first.save_path,
+        category=first.category,
+        is_skip_checking=skip_hash_check,
+        use_auto_torrent_management=False,
+        # Explicit, so a child set to not start torrents automatically still
+        # seeds them; nothing resumes batched adds afterwards.
+        is_paused=False,
+    )
+    if first.download_path:
+        add_kwargs["download_path"] = first.download_path
+
+    try:
+        response = child_client.torrents_add(**add_kwargs)
+    except Exception:
+        log.debug("Batched add of %d torrent(s) failed", len(items), exc_info=True)
+        response = "Fails."
+
+    if isinstance(response, dict) and (
+        not response.get("failure_count") and response.get("success_count") == len(items)
+    ):
+        # Web API 2.14+ reports per-request counts; all files were accepted.
+        arrived = {e.hash for e, _ in items}
+    elif response == "Fails.":
+        arrived = set()
+    else:
+        arrived = _wait_for_torrents(child_client, [e.hash for e, _ in items], abort=abort)
+
+    added = 0
+    missing: list[tuple[TorrentEntry, bytes]] = []
+    for entry, blob in items:
+        if entry.hash in arrived:
+            _log_added(entry)
             added += 1
-        except qbittorrentapi.Conflict409Error:
-            log.debug("Torrent already exists on child: %s", entry.name)
-            continue
+        else:
+            missing.append((entry, blob))
+    if missing and not (abort is not None and abort.is_set()):
+        log.debug("Retrying %d torrent(s) individually", len(missing))
+        added += sum(_add_one(child_client, e, blob, skip_hash_check, abort) for e, blob in missing)
+    return added
+
+
+def _wait_for_torrent(
+    client: qbittorrentapi.Client,
+    torrent_hash: str,
+    timeout: float = 5.0,
+    abort: threading.Event | None = None,
+) -> bool:
+    """Poll until *torrent_hash* is visible on *client*; return False on timeout."""
+    return bool(_wait_for_torrents(client, [torrent_hash], timeout, abort))
+
+
+def _wait_for_torrents(
+    client: qbittorrentapi.Client,
+    hashes: list[str],
+    timeout: float = 5.0,
+    abort: threading.Event | None = None,
+) -> set[str]:
+    """Poll until all *hashes* are visible on *client*; return those that are.
+
+    ``torrents_add`` returns before the torrent is queryable. Polling starts at
+    50 ms and backs off (capped at 500 ms), so the usual case costs one short
+    wait rather than a fixed sleep. Setting *abort* ends the wait early.
+    """
+    wanted = set(hashes)
+    seen: set[str] = set()
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            pending = list(wanted - seen)
+            seen.update(t["hash"] for t in client.torrents_info(torrent_hashes=pending))
+            if seen >= wanted:
+                return seen
         except Exception:
-            log.warning("Failed to add torrent %s — skipping", entry.name, exc_info=True)
-            continue
+            # A failed poll is treated like "not visible yet".
+            log.debug("Polling for %d torrent(s) failed", len(wanted - seen), exc_info=True)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return seen & wanted
+        if abort is None:
+            time.sleep(min(delay, remaining))
+        elif abort.wait(min(delay, remaining)):
+            return seen & wanted
+        delay = min(delay * 1.5, 0.5)
+
+
+def _add_one(
+    child_client: qbittorrentapi.Client,
+    entry: TorrentEntry,
+    torrent_bytes: bytes,
+    skip_hash_check: bool,
+    abort: threading.Event | None = None,
+) -> bool:
+    """Add one exported torrent to the child; return whether it was added.
 
-        if has_deselected:
-            deselected_ids = [
-                i for i, p in enumerate(entry.file_priorities) if p == 0
-            ]
-            time.sleep(1)
-            try:
-                child_client.torrents_file_priority(
-                    torrent_hash=entry.hash,
-                    file_ids=deselected_ids,
-                    priority=0,
-                )
-                log.debug(
-                    "Deselected %d file(s) for %s", len(deselected_ids), entry.name
-                )
-            except Exception:
-                log.warning(
-                    "Failed to set file priorities for %s", entry.name, exc_info=True
-                )
-            child_client.torrents_resume(torrent_hashes=entry.hash)
+    Torrents with deselected files are added paused and left paused with
+    their priorities applied; the caller resumes them.
+    """
+    has_deselected = entry.has_deselected
 
-    return added
+    add_kwargs: dict = dict(
+        torrent_files=torrent_bytes,
+        save_path=entry.save_path,
+        category=entry.category,
+        is_skip_checking=skip_hash_check,
+        use_auto_torrent_management=False,
+        is_paused=has_deselected,
+    )
+    if entry.download_path:
+        add_kwargs["download_path"] = entry.download_path
+
+    try:
+        child_client.torrents_add(**add_kwargs)
+        _log_added(entry)
+    except qbittorrentapi.Conflict409Error:
+        log.debug("Torrent already exists on child: %s", entry.name)
+        return False
+    except Exception:
+        log.warning("Failed to add torrent %s — skipping", entry.name, exc_info=True)
+        return False
+
+    if has_deselected:
+        deselected_ids = entry.deselected_ids
+        if not _wait_for_torrent(child_client, entry.hash, abort=abort):
+            log.warning("Torrent %s not visible on child after adding; setting priorities anyway", entry.name)
+        try:
+            child_client.torrents_file_priority(
+                torrent_hash=entry.hash,
+                file_ids=deselected_ids,
+                priority=0,
+            )
+            log.debug(
+                "Deselected %d file(s) for %s", len(deselected_ids), entry.name
+            )
+        except Exception:
+            log.warning(
+                "Failed to set file priorities for %s", entry.name, exc_info=True
+            )
+
+    return True
 
 
 def _apply_recategorize(
     child_client: qbittorrentapi.Client,
     entries: list[tuple[TorrentEntry, TorrentEntry]],
 ) -> int:
-    recategorized = 0
+    """Set categories with one request per target category rather than per torrent."""
+    by_category: dict[str, list[tuple[TorrentEntry, TorrentEntry]]] = defaultdict(list)
     for master_entry, child_entry in entries:
+        by_category[master_entry.category].append((master_entry, child_entry))
+
+    recategorized = 0
+    for category, group in by_category.items():
         try:
             child_client.torrents_set_category(
-                category=master_entry.category,
-                torrent_hashes=master_entry.hash,
+                category=category,
+                torrent_hashes=[m.hash for m, _ in group],
+            )
+        except Exception:
+            log.warning(
+                "Failed to recategorize %d torrent(s) to %r — skipping",
+                len(group),
+                category,
+                exc_info=True,
             )
+            continue
+        for master_entry, child_entry in group:
             log.info(
                 "Recategorized torrent: %s (%r → %r)",
                 master_entry.name,
                 child_entry.category,
                 master_entry.category,
             )
-            recategorized += 1
-        except Exception:
-            log.warning(
-                "Failed to recategorize torrent %s — skipping",
-                master_entry.name,
-                exc_info=True,
-            )
+        recategorized += len(group)
     return recategorized
 
 
@@ -370,88 +790,103 @@ def _apply_relocates(
     child_client: qbittorrentapi.Client,
     entries: list[tuple[TorrentEntry, TorrentEntry]],
 ) -> int:
-    relocated = 0
-    for master_entry, child_entry in entries:
-        h = master_entry.hash
-        try:
-            child_client.torrents_pause(torrent_hashes=h)
-
-            if master_entry.save_path != child_entry.save_path:
-                child_client.torrents_set_save_path(
-                    save_path=master_entry.save_path,
-                    torrent_hashes=h,
-                )
-
-            if master_entry.download_path != child_entry.download_path:
-                child_client.torrents_set_download_path(
-                    download_path=master_entry.download_path,
-                    torrent_hashes=h,
-                )
+    """Move child torrents to master's paths.
 
-            child_client.torrents_resume(torrent_hashes=h)
+    Torrents heading to the same new save/temp path are moved together: one
+    pause, one set-path call per changed path and one resume per group.
+    """
+    # Key: (new save_path or None, new download_path or None)
+    groups: dict[tuple[str | None, str | None], list[tuple[TorrentEntry, TorrentEntry]]] = defaultdict(list)
+    for master_entry, child_entry in entries:
+        save_path = master_entry.save_path if master_entry.save_path != child_entry.save_path else None
+        download_path = (
+            master_entry.download_path
+            if master_entry.download_path != child_entry.download_path
+            else None
+        )
+        groups[(save_path, download_path)].append((master_entry, child_entry))
 
+    relocated = 0
+    for (save_path, download_path), group in groups.items():
+        try:
+            _relocate(child_client, [m.hash for m, _ in group], save_path, download_path)
+        except Exception:
+            if len(group) == 1:
+                log.warning("Failed to relocate torrent %s — skipping", group[0][0].name, exc_info=True)
+                continue
+            # Retry one by one so a single bad torrent doesn't sink the group.
+            log.debug("Batched relocate of %d torrent(s) failed", len(group), exc_info=True)
+            ok_group = []
+            for pair in group:
+                try:
+                    _relocate(child_client, [pair[0].hash], save_path, download_path)
+                    ok_group.append(pair)
+                except Exception:
+                    log.warning("Failed to relocate torrent %s — skipping", pair[0].name, exc_info=True)
+            group = ok_group
+
+        for master_entry, child_entry in group:
             parts = []
-            if master_entry.save_path != child_entry.save_path:
+            if save_path is not None:
                 parts.append(f"save_path: {child_entry.save_path} → {master_entry.save_path}")
-            if master_entry.download_path != child_entry.download_path:
+            if download_path is not None:
                 parts.append(f"temp_path: {child_entry.download_path!r} → {master_entry.download_path!r}")
             log.info("Relocated torrent: %s (%s)", master_entry.name, "; ".join(parts))
-            relocated += 1
-        except Exception:
-            log.warning("Failed to relocate torrent %s — skipping", master_entry.name, exc_info=True)
+        relocated += len(group)
     return relocated
 
 
+def _relocate(
+    child_client: qbittorrentapi.Client,
+    hashes: list[str],
+    save_path: str | None,
+    download_path: str | None,
+) -> None:
+    child_client.torrents_pause(torrent_hashes=hashes)
+    if save_path is not None:
+        child_client.torrents_set_save_path(save_path=save_path, torrent_hashes=hashes)
+    if download_path is not None:
+        child_client.torrents_set_download_path(download_path=download_path, torrent_hashes=hashes)
+    child_client.torrents_resume(torrent_hashes=hashes)
+
+
 def _filter_needed_file_syncs(
     child_client: qbittorrentapi.Client,
-    entries: list[TorrentEntry],
-) -> list[TorrentEntry]:
-    """Keep only entries where the child's file priorities actually differ from master."""
-    needed: list[TorrentEntry] = []
-    for master_entry in entries:
-        if not master_entry.file_priorities:
-            continue
-        try:
-            child_files = child_client.torrents_files(torrent_hash=master_entry.hash)
-        except Exception:
-            needed.append(master_entry)
+    entries: list[tuple[TorrentEntry, tuple[int, ...]]],
+    workers: int = 8,
+    abort: threading.Event | None = None,
+) -> list[tuple[TorrentEntry, tuple[int, ...]]]:
+    """Narrow each entry's ids to the files still selected on the child.
+
+    Entries whose child files already match are dropped. If the child's file
+    list can't be fetched, the entry is kept with all of master's deselected ids.
+    """
+    child_files_by_hash = _fetch_files_parallel(
+        child_client, [e.hash for e, _ in entries], workers, abort,
+    )
+    needed: list[tuple[TorrentEntry, tuple[int, ...]]] = []
+    for master_entry, ids in entries:
+        child_files = child_files_by_hash[master_entry.hash]
+        if child_files is None:
+            needed.append((master_entry, ids))
             continue
-        has_diff = any(
-            mp == 0 and i < len(child_files) and child_files[i].priority != 0
-            for i, mp in enumerate(master_entry.file_priorities)
+        n_child = len(child_files)
+        ids_to_deselect = tuple(
+            i for i in ids
+            if i < n_child and child_files[i]["priority"] != 0
         )
-        if has_diff:
-            needed.append(master_entry)
+        if ids_to_deselect:
+            needed.append((master_entry, ids_to_deselect))
     return needed
 
 
 def _apply_file_priority_sync(
     child_client: qbittorrentapi.Client,
-    entries: list[TorrentEntry],
+    entries: list[tuple[TorrentEntry, tuple[int, ...]]],
 ) -> int:
     """Deselect files on child that master has deselected."""
     synced = 0
-    for master_entry in entries:
-        if not master_entry.file_priorities:
-            continue
-
-        try:
-            child_files = child_client.torrents_files(torrent_hash=master_entry.hash)
-        except Exception:
-            log.warning(
-                "Failed to fetch files for %s on child — skipping", master_entry.name
-            )
-            continue
-
-        ids_to_deselect = [
-            i
-            for i, mp in enumerate(master_entry.file_priorities)
-            if mp == 0 and i < len(child_files) and child_files[i].priority != 0
-        ]
-
-        if not ids_to_deselect:
-            continue
-
+    for master_entry, ids_to_deselect in entries:
         try:
             child_client.torrents_file_priority(
                 torrent_hash=master_entry.hash,
@@ -477,56 +912,68 @@ def _apply_file_priority_sync(
 # Summary output
 # ---------------------------------------------------------------------------
 
+_TABLE_ROW_LIMIT = 10
+
+
+def _details(items: list, describe: Callable[[Any], str]) -> str:
+    """Describe the first few *items*, one per line, noting how many were left out."""
+    lines = [describe(item) for item in islice(items, _TABLE_ROW_LIMIT)]
+    if len(items) > _TABLE_ROW_LIMIT:
+        lines.append(f"… and {len(items) - _TABLE_ROW_LIMIT} more")
+    return "\n".join(lines)
+
+
+def _describe_relocate(pair: tuple[TorrentEntry, TorrentEntry]) -> str:
+    master_e, child_e = pair
+    parts: list[str] = []
+    if master_e.save_path != child_e.save_path:
+        parts.append(f"{child_e.save_path} → {master_e.save_path}")
+    if master_e.download_path != child_e.download_path:
+        parts.append(f"temp: {child_e.download_path or '(none)'} → {master_e.download_path or '(none)'}")
+    return f"{master_e.name}: {'; '.join(parts)}"
+
+
 def _print_diff_table(diff: SyncDiff, console: Console, dry_run: bool) -> None:
+    if console.quiet:
+        return
     label = "[bold yellow][DRY RUN][/] " if dry_run else ""
+    if diff.is_empty:
+        console.print(f"  {label}[dim]{diff.child_name}: already in sync[/]")
+        return
+
     title = f"{label}Sync summary for [bold cyan]{diff.child_name}[/]"
 
-    table = Table(title=title, show_lines=True)
+    # Row separators help on a terminal but only add noise to logs/pipes.
+    table = Table(title=title, show_lines=console.is_terminal)
     table.add_column("Action", style="bold")
     table.add_column("Count", justify="right")
     table.add_column("Details")
 
     if diff.to_delete:
-        names = "\n".join(e.name for e in diff.to_delete[:10])
-        if len(diff.to_delete) > 10:
-            names += f"\n… and {len(diff.to_delete) - 10} more"
-        table.add_row("[red]Delete[/]", str(len(diff.to_delete)), names)
-
+        table.add_row(
+            "[red]Delete[/]", str(len(diff.to_delete)),
+            _details(diff.to_delete, lambda e: e.name),
+        )
     if diff.to_add:
-        names = "\n".join(e.name for e in diff.to_add[:10])
-        if len(diff.to_add) > 10:
-            names += f"\n… and {len(diff.to_add) - 10} more"
-        table.add_row("[green]Add[/]", str(len(diff.to_add)), names)
-
+        table.add_row(
+            "[green]Add[/]", str(len(diff.to_add)),
+            _details(diff.to_add, lambda e: e.name),
+        )
     if diff.to_recategorize:
-        details: list[str] = []
-        for master_e, child_e in diff.to_recategorize[:10]:
-            details.append(f"{master_e.name}: {child_e.category!r} → {master_e.category!r}")
-        if len(diff.to_recategorize) > 10:
-            details.append(f"… and {len(diff.to_recategorize) - 10} more")
-        table.add_row("[cyan]Recategorize[/]", str(len(diff.to_recategorize)), "\n".join(details))
-
+        table.add_row(
+            "[cyan]Recategorize[/]", str(len(diff.to_recategorize)),
+            _details(diff.to_recategorize, lambda p: f"{p[0].name}: {p[1].category!r} → {p[0].category!r}"),
+        )
     if diff.to_relocate:
-        details = []
-        for master_e, child_e in diff.to_relocate[:10]:
-            parts: list[str] = []
-            if master_e.save_path != child_e.save_path:
-                parts.append(f"{child_e.save_path} → {master_e.save_path}")
-            if master_e.download_path != child_e.download_path:
-                parts.append(f"temp: {child_e.download_path or '(none)'} → {master_e.download_path or '(none)'}")
-            details.append(f"{master_e.name}: {'; '.join(parts)}")
-        if len(diff.to_relocate) > 10:
-            details.append(f"… and {len(diff.to_relocate) - 10} more")
-        table.add_row("[yellow]Relocate[/]", str(len(diff.to_relocate)), "\n".join(details))
-
+        table.add_row(
+            "[yellow]Relocate[/]", str(len(diff.to_relocate)),
+            _details(diff.to_relocate, _describe_relocate),
+        )
     if diff.to_sync_files:
-        names = "\n".join(e.name for e in diff.to_sync_files[:10])
-        if len(diff.to_sync_files) > 10:
-            names += f"\n… and {len(diff.to_sync_files) - 10} more"
-        table.add_row("[magenta]File selection[/]", str(len(diff.to_sync_files)), names)
-
-    if diff.is_empty:
-        table.add_row("[dim]—[/]", "0", "Already in sync")
+        table.add_row(
+            "[magenta]File selection[/]", str(len(diff.to_sync_files)),
+            _details(diff.to_sync_files, lambda p: p[0].name),
+        )
 
     console.print(table)
 
@@ -535,7 +982,7 @@ def _print_diff_table(diff: SyncDiff, console: Console, dry_run: bool) -> None:
 # Pre-sync cleanup
 # ---------------------------------------------------------------------------
 
-_STALE_STATES = {"error", "missingfiles"}
+_STALE_STATES = frozenset({"error", "missingfiles"})
 
 
 def _cleanup_stale_torrents(
@@ -543,9 +990,15 @@ def _cleanup_stale_torrents(
     child_name: str,
     console: Console,
     dry_run: bool,
-) -> int:
-    """Remove errored or 0-progress torrents from a child before sync."""
-    torrents = client.torrents_info()
+    torrents: list | None = None,
+) -> set[str]:
+    """Remove errored or 0-progress torrents from a child before sync.
+
+    Pass *torrents* to reuse an already fetched ``torrents_info`` response.
+    Returns the hashes of the stale torrents found, including in dry-run mode.
+    """
+    if torrents is None:
+        torrents = client.torrents_info()
     to_remove: list[tuple[str, str, str]] = []
 
     for t in torrents:
@@ -562,7 +1015,7 @@ def _cleanup_stale_torrents(
 
     if not to_remove:
         console.print("  No stale torrents found.")
-        return 0
+        return set()
 
     table = Table(
         title=f"Stale torrents on [bold cyan]{child_name}[/]",
@@ -578,7 +1031,7 @@ def _cleanup_stale_torrents(
         console.print(
             f"  [bold yellow][DRY RUN][/] Would remove {len(to_remove)} stale torrent(s).\n"
         )
-        return 0
+        return {h for h, _, _ in to_remove}
 
     hashes = [h for h, _, _ in to_remove]
     client.torrents_delete(delete_files=False, torrent_hashes=hashes)
@@ -586,7 +1039,7 @@ def _cleanup_stale_torrents(
     console.print(
         f"  Removed [bold red]{len(to_remove)}[/] stale torrent(s).\n"
     )
-    return len(to_remove)
+    return set(hashes)
 
 
 # ---------------------------------------------------------------------------
@@ -609,19 +1062,14 @@ def _filter_by_tracker(
 
     filtered: dict[str, TorrentEntry] = {}
     skipped = 0
+    verdicts: dict[str, str | None] = {}
     for h, entry in master.items():
         tracker = entry.tracker
-
-        if include and not any(p.search(tracker) for p in include):
+        reason = _tracker_rejection(tracker, include, exclude, verdicts)
+        if reason:
             skipped += 1
-            log.debug("Tracker filter (include miss): %s [%s]", entry.name, tracker)
+            log.debug("Tracker filter (%s): %s [%s]", reason, entry.name, tracker)
             continue
-
-        if exclude and any(p.search(tracker) for p in exclude):
-            skipped += 1
-            log.debug("Tracker filter (exclude hit): %s [%s]", entry.name, tracker)
-            continue
-
         filtered[h] = entry
 
     if skipped:
@@ -629,36 +1077,324 @@ def _filter_by_tracker(
     return filtered
 
 
+def _tracker_rejection(
+    tracker: str,
+    include: list[re.Pattern[str]] | None,
+    exclude: list[re.Pattern[str]] | None,
+    verdicts: dict[str, str | None],
+) -> str | None:
+    """Return why *tracker* is filtered out ("include miss"/"exclude hit"), or None.
+
+    Most torrents share a handful of tracker URLs, so results are memoized in
+    *verdicts* and each distinct URL is run through the regexes only once.
+    """
+    try:
+        return verdicts[tracker]
+    except KeyError:
+        pass
+    if include and not any(p.search(tracker) for p in include):
+        reason: str | None = "include miss"
+    elif exclude and any(p.search(tracker) for p in exclude):
+        reason = "exclude hit"
+    else:
+        reason = None
+    verdicts[tracker] = reason
+    return reason
+
+
 # ---------------------------------------------------------------------------
-# Main orchestrator
+# Incremental master fetch
 # ---------------------------------------------------------------------------
 
-def run_sync(cfg: AppConfig, *, dry_run: bool, console: Console) -> None:
-    """Execute a full sync cycle."""
-    min_seed_secs = cfg.sync.min_seeding_time_minutes * 60
+# Torrent fields that change when file selections or completion change; while
+# they stay put, a torrent's cached file priorities are still valid.
+_FILES_FINGERPRINT = itemgetter("size", "progress", "completion_on")
+
+
+@dataclass(slots=True)
+class MasterSnapshot:
+    """Master state carried between sync cycles of a long-running process.
 
-    # --- pre-sync: clean stale torrents from children ---
-    console.print("\n[bold]Pre-sync cleanup[/]: scanning children for stale torrents …\n")
-    for child_cfg in cfg.children:
-        console.rule(f"[dim]{child_cfg.name}[/] — {child_cfg.host}")
+    qBittorrent tracks ``sync/maindata`` response ids per web session, so the
+    logged-in client is kept alongside the merged torrent data.
+    """
+
+    client: qbittorrentapi.Client | None = None
+    rid: int = 0
+    torrents: dict[str, dict] = field(default_factory=dict)
+    priorities: dict[str, tuple[tuple | None, bytes]] = field(default_factory=dict)
+
+    def refresh(self, client: qbittorrentapi.Client) -> list[dict]:
+        """Merge the changes since the last call and return all torrents."""
+        data = client.sync_maindata(rid=self.rid)
+        if data.get("full_update"):
+            self.torrents = {}
+        for h, changed in (data.get("torrents") or {}).items():
+            t = self.torrents.get(h)
+            if t is None:
+                t = self.torrents[h] = {"hash": h}
+            t.update(changed)
+        for h in data.get("torrents_removed") or ():
+            self.torrents.pop(h, None)
+        self.rid = data.get("rid", 0)
+
+        for h in self.priorities.keys() - self.torrents.keys():
+            del self.priorities[h]
+        return list(self.torrents.values())
+
+    def cached_priorities(self, torrent_hash: str) -> bytes | None:
+        cached = self.priorities.get(torrent_hash)
+        if cached is None:
+            return None
+        fingerprint, priorities = cached
+        current = _fingerprint(self.torrents[torrent_hash])
+        if current is None or current != fingerprint:
+            return None
+        return priorities
+
+    def store_priorities(self, torrent_hash: str, priorities: bytes) -> None:
+        self.priorities[torrent_hash] = (_fingerprint(self.torrents[torrent_hash]), priorities)
+
+
+def _fingerprint(t: dict) -> tuple | None:
+    # None (fields missing) never matches, so priorities are always re-fetched.
+    try:
+        return _FILES_FINGERPRINT(t)
+    except KeyError:
+        return None
+
+
+# Snapshots keyed by everything the kept client was built from (host,
+# credentials, pool size), kept for the lifetime of the process.
+_MASTER_SNAPSHOTS: dict[tuple[str, str, str, int], MasterSnapshot] = {}
+
+
+def _master_snapshot(cfg: AppConfig) -> MasterSnapshot:
+    """Return the snapshot for the configured master.
+
+    A fresh snapshot (and so a fresh client) is used whenever the master's
+    connection settings changed since the previous cycle.
+    """
+    key = (cfg.master.host, cfg.master.username, cfg.master.password, _master_connections(cfg))
+    snapshot = _MASTER_SNAPSHOTS.get(key)
+    if snapshot is None:
+        # A config reload changed the master connection; the old client and
+        # its sync/maindata session are of no further use.
+        _MASTER_SNAPSHOTS.clear()
+        snapshot = _MASTER_SNAPSHOTS[key] = MasterSnapshot()
+    return snapshot
+
+
+# ---------------------------------------------------------------------------
+# Export cache
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class ExportCache:
+    """On-disk cache of master ``.torrent`` exports, keyed by info-hash.
+
+    A .torrent for a given hash never changes, so entries never go stale; the
+    cache only needs pruning by size. Read and write failures are non-fatal:
+    the torrent is simply exported from master again.
+    """
+
+    directory: Path
+    max_bytes: int
+
+    def _path(self, torrent_hash: str) -> Path:
+        return self.directory / f"{torrent_hash}.torrent"
+
+    def get(self, torrent_hash: str) -> bytes | None:
+        path = self._path(torrent_hash)
         try:
-            child_client = _connect(child_cfg)
-        except Exception:
-            log.error(
-                "Cannot connect to child %s at %s — skipping cleanup",
-                child_cfg.name,
-                child_cfg.host,
-            )
-            continue
-        _cleanup_stale_torrents(child_client, child_cfg.name, console, dry_run)
+            data = path.read_bytes()
+            os.utime(path)  # mark as recently used for prune()
+        except OSError:
+            return None
+        return data or None
+
+    def put(self, torrent_hash: str, data: bytes) -> None:
+        path = self._path(torrent_hash)
+        # Write under a temporary name so a concurrent reader never sees a
+        # partial file.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            log.debug("Could not cache .torrent for %s", torrent_hash, exc_info=True)
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
 
-    # --- master ---
-    console.print(f"\nConnecting to master [bold]{cfg.master.host}[/] …")
+    def prune(self) -> None:
+        """Remove least recently used files until the cache fits *max_bytes*."""
+        try:
+            with os.scandir(self.directory) as it:
+                files = [
+                    (st.st_mtime, st.st_size, e.path)
+                    for e in it
+                    if e.name.endswith(".torrent") and e.is_file()
+                    for st in (e.stat(),)
+                ]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        if total <= self.max_bytes:
+            return
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        log.debug("Pruned export cache to %d bytes", total)
+
+
+# ---------------------------------------------------------------------------
+# Main orchestrator
+# ---------------------------------------------------------------------------
+
+def _buffered_console(console: Console) -> Console:
+    """Return a console that renders like *console* but into an in-memory buffer."""
+    return Console(
+        file=io.StringIO(),
+        width=console.width,
+        color_system=console.color_system,
+        force_terminal=console.is_terminal,
+        no_color=console.no_color,
+        quiet=console.quiet,
+        highlight=False,
+    )
+
+
+def _sync_one_child(
+    child_cfg: InstanceConfig,
+    cfg: AppConfig,
+    master_client: qbittorrentapi.Client,
+    master_torrents: dict[str, TorrentEntry],
+    *,
+    dry_run: bool,
+    console: Console,
+    export_cache: ExportCache | None = None,
+    abort: threading.Event | None = None,
+) -> ChildResult:
+    """Clean up, diff and (unless *dry_run*) sync a single child.
+
+    When *abort* is set (Ctrl-C in the main thread), the child stops at the
+    next phase boundary and returns what it has done so far.
+    """
+    sync_files = cfg.sync.sync_file_selections
+    result = ChildResult(child_name=child_cfg.name)
+
+    def aborted() -> bool:
+        return abort is not None and abort.is_set()
+
+    console.rule(f"[bold]{child_cfg.name}[/] — {child_cfg.host}")
     try:
-        master_client = _connect(cfg.master)
+        child_client = _connect(child_cfg, cfg.sync.fetch_concurrency)
     except Exception:
-        log.exception("Cannot connect to master at %s", cfg.master.host)
-        raise
+        log.error("Cannot connect to child %s at %s — skipping", child_cfg.name, child_cfg.host)
+        result.failed = True
+        return result
+
+    # One torrents_info response serves both stale cleanup and the diff.
+    torrents = child_client.torrents_info()
+    if aborted():
+        return result
+    stale = _cleanup_stale_torrents(child_client, child_cfg.name, console, dry_run, torrents)
+    if stale and not dry_run:
+        torrents = [t for t in torrents if t["hash"] not in stale]
+
+    child_torrents = _fetch_child_torrents(child_client, torrents)
+    log.debug("Child %s has %d torrent(s)", child_cfg.name, len(child_torrents))
+
+    master_path = cfg.master.path
+    child_path = child_cfg.path
+    if master_path and child_path:
+        translated_master = {
+            h: _translate_entry(e, master_path, child_path)
+            for h, e in master_torrents.items()
+        }
+        console.print(f"  [dim]Path translation: {master_path} → {child_path}[/]")
+    else:
+        translated_master = master_torrents
+
+    if child_cfg.tracker_include or child_cfg.tracker_exclude:
+        before = len(translated_master)
+        translated_master = _filter_by_tracker(
+            translated_master, child_cfg.tracker_include, child_cfg.tracker_exclude,
+        )
+        console.print(
+            f"  [dim]Tracker filter: {len(translated_master)}/{before} torrent(s) matched[/]"
+        )
+
+    diff = compute_diff(translated_master, child_torrents, child_cfg.name)
+    if sync_files and not aborted():
+        diff.to_sync_files = _filter_needed_file_syncs(
+            child_client, diff.to_sync_files, cfg.sync.fetch_concurrency, abort,
+        )
+    _print_diff_table(diff, console, dry_run)
+    result.changes = len(stale) + diff.change_count
+
+    if dry_run or diff.is_empty or aborted():
+        return result
+
+    result.deleted = _apply_deletes(child_client, diff.to_delete)
+    if aborted():
+        return result
+    result.added = _apply_adds(
+        master_client, child_client, diff.to_add, cfg.sync.skip_hash_check,
+        workers=cfg.sync.fetch_concurrency, export_cache=export_cache, abort=abort,
+    )
+    if aborted():
+        return result
+    result.recategorized = _apply_recategorize(child_client, diff.to_recategorize)
+    if aborted():
+        return result
+    result.relocated = _apply_relocates(child_client, diff.to_relocate)
+    if sync_files and not aborted():
+        result.file_synced = _apply_file_priority_sync(child_client, diff.to_sync_files)
+
+    console.print(
+        f"\n  [bold green]Done:[/] {result.deleted} deleted, {result.added} added,"
+        f" {result.recategorized} recategorized, {result.relocated} relocated,"
+        f" {result.file_synced} file-selection synced.\n"
+    )
+    return result
+
+
+def run_sync(cfg: AppConfig, *, dry_run: bool, console: Console) -> tuple[int, int]:
+    """Execute a full sync cycle.
+
+    Returns ``(changes, failed)``: the number of changes found across all
+    children (stale torrents plus diff actions), whether or not they were
+    applied, and the number of children that failed. A failing child is
+    logged and does not stop the others.
+    """
+    min_seed_secs = cfg.sync.min_seeding_time_minutes * 60
+
+    # --- master ---
+    snapshot: MasterSnapshot | None = None
+    if cfg.sync.incremental_master_fetch:
+        snapshot = _master_snapshot(cfg)
+
+    if snapshot is not None and snapshot.client is not None:
+        master_client = snapshot.client
+    else:
+        console.print(f"\nConnecting to master [bold]{cfg.master.host}[/] …")
+        try:
+            master_client = _connect(cfg.master, _master_connections(cfg))
+        except Exception:
+            log.exception("Cannot connect to master at %s", cfg.master.host)
+            raise
+        if snapshot is not None:
+            snapshot.client = master_client
 
     sync_files = cfg.sync.sync_file_selections
     treat_stopped = cfg.sync.treat_stopped_as_removed
@@ -670,6 +1406,8 @@ def run_sync(cfg: AppConfig, *, dry_run: bool, console: Console) -> None:
         private_only=private_only,
         tracker_include=cfg.master.tracker_include or None,
         tracker_exclude=cfg.master.tracker_exclude or None,
+        workers=cfg.sync.fetch_concurrency,
+        snapshot=snapshot,
     )
     console.print(f"  Found [bold]{len(master_torrents)}[/] eligible torrent(s) on master.")
     if cfg.master.tracker_include or cfg.master.tracker_exclude:
@@ -683,53 +1421,58 @@ def run_sync(cfg: AppConfig, *, dry_run: bool, console: Console) -> None:
     console.print()
 
     # --- children ---
-    for child_cfg in cfg.children:
-        console.rule(f"[bold]{child_cfg.name}[/] — {child_cfg.host}")
-        try:
-            child_client = _connect(child_cfg)
-        except Exception:
-            log.error("Cannot connect to child %s at %s — skipping", child_cfg.name, child_cfg.host)
-            continue
-
-        child_torrents = _fetch_child_torrents(child_client)
-        log.debug("Child %s has %d torrent(s)", child_cfg.name, len(child_torrents))
-
-        master_path = cfg.master.path
-        child_path = child_cfg.path
-        if master_path and child_path:
-            translated_master = {
-                h: _translate_entry(e, master_path, child_path)
-                for h, e in master_torrents.items()
-            }
-            console.print(f"  [dim]Path translation: {master_path} → {child_path}[/]")
-        else:
-            translated_master = master_torrents
-
-        if child_cfg.tracker_include or child_cfg.tracker_exclude:
-            before = len(translated_master)
-            translated_master = _filter_by_tracker(
-                translated_master, child_cfg.tracker_include, child_cfg.tracker_exclude,
-            )
-            console.print(
-                f"  [dim]Tracker filter: {len(translated_master)}/{before} torrent(s) matched[/]"
+    # Children are independent instances, so they sync concurrently. Each one
+    # renders into its own buffer, flushed in config order so output from
+    # different children never interleaves.
+    buffers = [_buffered_console(console) for _ in cfg.children]
+    export_cache: ExportCache | None = None
+    if cfg.sync.export_cache_mb:
+        export_cache = ExportCache(
+            Path(cfg.sync.export_cache_dir).expanduser(),
+            cfg.sync.export_cache_mb * 1024 * 1024,
+        )
+    results: list[ChildResult] = []
+    abort = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=len(cfg.children))
+    try:
+        futures = [
+            pool.submit(
+                _sync_one_child, child_cfg, cfg, master_client, master_torrents,
+                dry_run=dry_run, console=buf, export_cache=export_cache, abort=abort,
             )
+            for child_cfg, buf in zip(cfg.children, buffers)
+        ]
+        # A failing child must not affect the others: its error is logged
+        # and recorded on its result, and the cycle carries on.
+        for child_cfg, future, buf in zip(cfg.children, futures, buffers):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                log.error("Sync failed for child %s", child_cfg.name, exc_info=exc)
+                results.append(ChildResult(child_name=child_cfg.name, failed=True))
+            console.file.write(buf.file.getvalue())
+            console.file.flush()
+    except KeyboardInterrupt:
+        # Don't wait for in-flight children: tell them to stop at their next
+        # phase boundary and let the interrupt through right away.
+        abort.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
 
-        diff = compute_diff(translated_master, child_torrents, child_cfg.name)
-        if sync_files:
-            diff.to_sync_files = _filter_needed_file_syncs(child_client, diff.to_sync_files)
-        _print_diff_table(diff, console, dry_run)
-
-        if dry_run or diff.is_empty:
-            continue
+    if export_cache is not None and not dry_run:
+        export_cache.prune()
 
-        deleted = _apply_deletes(child_client, diff.to_delete)
-        added = _apply_adds(master_client, child_client, diff.to_add, cfg.sync.skip_hash_check)
-        recategorized = _apply_recategorize(child_client, diff.to_recategorize)
-        relocated = _apply_relocates(child_client, diff.to_relocate)
-        file_synced = _apply_file_priority_sync(child_client, diff.to_sync_files) if sync_files else 0
+    failed = [r.child_name for r in results if r.failed]
+    if failed:
+        log.warning("%d of %d child(ren) failed this cycle: %s", len(failed), len(results), ", ".join(failed))
 
+    if not dry_run and len(results) > 1:
         console.print(
-            f"\n  [bold green]Done:[/] {deleted} deleted, {added} added,"
-            f" {recategorized} recategorized, {relocated} relocated,"
-            f" {file_synced} file-selection synced.\n"
+            f"[bold]All children:[/] {sum(r.deleted for r in results)} deleted,"
+            f" {sum(r.added for r in results)} added,"
+            f" {sum(r.recategorized for r in results)} recategorized,"
+            f" {sum(r.relocated for r in results)} relocated,"
+            f" {sum(r.file_synced for r in results)} file-selection synced.\n"
         )
+    return sum(r.changes for r in results), len(failed)